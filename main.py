@@ -9,10 +9,23 @@
 
 # FastAPI: Framework principal para crear APIs REST modernas y rápidas
 # HTTPException: Para manejar errores HTTP de manera elegante
-from fastapi import FastAPI, HTTPException
+# Request: Para leer las cabeceras de la petición
+# Response: Para construir respuestas sin cuerpo (por ejemplo, 304 Not Modified)
+from fastapi import FastAPI, HTTPException, Request, Response
+
+# ORJSONResponse: Respuesta JSON generada con orjson (escrito en Rust), mucho más
+# rápido que el módulo json estándar, sobre todo con fechas (datetime)
+from fastapi.responses import ORJSONResponse
+
+# RequestValidationError: El error que FastAPI convierte en una respuesta 422
+from fastapi.exceptions import RequestValidationError
 
 # BaseModel: Clase base de Pydantic para crear modelos de datos con validación automática
-from pydantic import BaseModel
+# Field: Para configurar campos, por ejemplo valores por defecto calculados
+# ConfigDict: Para configurar el comportamiento de un modelo (API de Pydantic v2)
+# TypeAdapter: Validador de Pydantic para cualquier tipo (por ejemplo, una lista de modelos)
+# ValidationError: Error que lanza Pydantic cuando los datos no cumplen el modelo
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter, ValidationError
 
 # Para trabajar con fechas y timestamps
 from datetime import datetime
@@ -21,19 +34,63 @@ from datetime import datetime
 from uuid import uuid4 as uuid
 
 # Tipos de datos especiales para hacer el código más legible y seguro
-from typing import Optional, Text
+# NoReturn: Indica que una función nunca termina normalmente (siempre lanza un error)
+from typing import NoReturn, Optional
+
+# defaultdict: Diccionario que crea automáticamente un valor por defecto para
+# las claves nuevas (en nuestro caso, un diccionario vacío)
+from collections import defaultdict
 
 # INICIALIZACIÓN DE LA APLICACIÓN FASTAPI
 # ============================================================================
 # Creamos la instancia principal de nuestra aplicación
 # FastAPI() crea automáticamente documentación interactiva en /docs
-app = FastAPI()
+# default_response_class hace que todos los endpoints respondan con ORJSONResponse
+app = FastAPI(default_response_class=ORJSONResponse)
 
 # BASE DE DATOS EN MEMORIA (SIMULADA)
 # ============================================================================
 # En un proyecto real, esto sería una base de datos como PostgreSQL, MySQL, etc.
-# Para este ejemplo didáctico, usamos una lista simple en memoria
-posts = []
+# Para este ejemplo didáctico, usamos un diccionario en memoria indexado por ID:
+# así buscar, actualizar o eliminar un post es una operación directa (O(1))
+# en lugar de recorrer toda la colección
+# Las fechas se guardan ya convertidas a texto ISO 8601 (model_dump(mode="json")),
+# así no hay que volver a formatearlas cada vez que se envían en una respuesta
+posts: dict[str, dict] = {}
+
+# ÍNDICE SECUNDARIO POR AUTOR
+# ============================================================================
+# Para cada autor guardamos los IDs de sus posts. Así filtrar por autor solo
+# recorre los posts de ese autor, no toda la colección.
+# Usamos un diccionario {post_id: None} como "conjunto ordenado": a diferencia
+# de un set, conserva el orden de inserción, así ?author= devuelve los posts
+# en el mismo orden que GET /posts (y en el mismo orden en cada ejecución).
+# Única excepción: si se cambia el autor de un post, pasa al final de la
+# lista de su nuevo autor
+# El índice se mantiene al día en cada creación, actualización y eliminación
+by_author: dict[str, dict[str, None]] = defaultdict(dict)
+
+# VERSIONES PARA CACHÉ HTTP (ETag)
+# ============================================================================
+# posts_version aumenta con cada escritura (crear, actualizar o eliminar) y
+# post_versions guarda la versión de la última escritura de cada post.
+# Con ellas generamos el ETag de las respuestas GET: si el cliente ya tiene
+# esa versión, respondemos 304 Not Modified sin volver a enviar los datos
+# BOOT_ID es un valor aleatorio distinto en cada proceso: lo incluimos en el
+# ETag porque cada worker cuenta sus versiones desde 0 con sus propios datos,
+# así un ETag generado por otro worker (o antes de reiniciar) nunca coincide
+BOOT_ID = uuid().hex[:8]
+posts_version = 0
+post_versions: dict[str, int] = {}
+
+# RESPUESTAS CONSTANTES
+# ============================================================================
+# El mensaje de bienvenida nunca cambia: lo creamos una sola vez al arrancar
+# en lugar de construir un diccionario nuevo en cada petición
+WELCOME_MESSAGE = {"Welcome": "Bienvenido a mi Clase de FastAPI"}
+
+# Mensaje del error 404 que comparten todos los endpoints que buscan un post
+NOT_FOUND_DETAIL = "Post no encontrado"
 
 # MODELOS DE DATOS (SCHEMAS)
 # ============================================================================
@@ -41,29 +98,230 @@ posts = []
 # Pydantic se encarga automáticamente de validar que los datos cumplan estas reglas
 
 
-# Modelo principal para crear y representar un post del blog
+# Modelo principal para representar un post del blog ya almacenado
 class Post(BaseModel):
-    id: Optional[str]  # ID único, se genera automáticamente, por eso es opcional
+    # extra="forbid": rechaza (error 422) cualquier campo que no esté en el modelo
+    model_config = ConfigDict(extra="forbid")
+
+    id: str  # ID único, siempre lo genera el servidor
     title: str  # Título del post (obligatorio)
     author: str  # Autor del post (obligatorio)
-    content: Text  # Contenido del post (texto largo, obligatorio)
-    created_at: datetime = datetime.now()  # Fecha de creación (automática)
+    content: str  # Contenido del post (texto largo, obligatorio)
+    # Fecha de creación (automática). default_factory calcula la fecha en cada
+    # post nuevo; con "= datetime.now()" se calcularía una sola vez al importar
+    created_at: datetime = Field(default_factory=datetime.now)
     published_at: Optional[datetime] = None  # Fecha de publicación (opcional)
     published: bool = False  # Estado de publicación (por defecto no publicado)
 
 
+# Modelo específico para crear posts
+# No incluye "id" ni "created_at": ambos los asigna el servidor, así el cliente
+# no puede inventarse sus propios IDs
+class PostCreate(BaseModel):
+    model_config = ConfigDict(extra="forbid")
+
+    title: str
+    author: str
+    content: str
+    published_at: Optional[datetime] = None
+    published: bool = False
+
+
 # Modelo específico para actualizaciones
 # Separamos este modelo para tener más control sobre qué campos se pueden actualizar
+# Tampoco incluye "created_at": la fecha de creación la asigna el servidor al
+# crear el post y no cambia al actualizarlo
 class PostUpdate(BaseModel):
+    model_config = ConfigDict(extra="forbid")
+
     title: str
     author: str
-    content: Text
-    created_at: datetime = datetime.now()
+    content: str
+
+
+# VALIDADORES PRECONSTRUIDOS
+# ============================================================================
+# Construimos el validador de una lista de posts una sola vez al arrancar.
+# validate_json() lee y valida el JSON directamente en el núcleo de Pydantic
+# (escrito en Rust), sin pasar antes por json.loads ni por el sistema de
+# dependencias de FastAPI
+post_list_adapter = TypeAdapter(list[PostCreate])
+
+# Esquema JSON de esa lista para la documentación (/docs). Las referencias a
+# modelos apuntan a components/schemas de OpenAPI; las definiciones ($defs)
+# se registran allí más abajo, en openapi_with_bulk_defs()
+bulk_body_schema = post_list_adapter.json_schema(
+    ref_template="#/components/schemas/{model}"
+)
+bulk_body_defs = bulk_body_schema.pop("$defs", {})
+
+
+# FUNCIONES AUXILIARES
+# ============================================================================
+
+
+def bump_version(post_id: str):
+    """
+    Registra una escritura sobre un post para invalidar los ETag anteriores
+
+    Args:
+        post_id (str): ID del post creado o actualizado
+    """
+    global posts_version
+    posts_version += 1
+    post_versions[post_id] = posts_version
+
+
+def raise_not_found() -> NoReturn:
+    """
+    Lanza el error 404 de "post no encontrado"
+
+    Centraliza la creación de la excepción que usan varios endpoints.
+    Creamos una excepción nueva en cada llamada (no reutilizamos una única
+    instancia) porque Python guarda en ella la traza de cada lanzamiento.
+    La anotación -> NoReturn indica que, tras llamarla, el endpoint no continúa
+
+    Raises:
+        HTTPException: Error 404 con el mensaje NOT_FOUND_DETAIL
+    """
+    raise HTTPException(status_code=404, detail=NOT_FOUND_DETAIL)
+
+
+def index_author(post_id: str, author: str):
+    """
+    Añade un post al índice de su autor
+
+    Args:
+        post_id (str): ID del post
+        author (str): Autor del post
+    """
+    by_author[author][post_id] = None
+
+
+def unindex_author(post_id: str, author: str):
+    """
+    Quita un post del índice de su autor (y al autor, si se queda sin posts)
+
+    Args:
+        post_id (str): ID del post
+        author (str): Autor del post
+    """
+    ids = by_author[author]
+    ids.pop(post_id, None)
+    if not ids:
+        del by_author[author]
+
+
+def drop_version(post_id: str):
+    """
+    Registra la eliminación de un post: la colección cambia de versión
+    y el post deja de tener versión propia
+
+    Args:
+        post_id (str): ID del post eliminado
+    """
+    global posts_version
+    posts_version += 1
+    post_versions.pop(post_id, None)
+
+
+def is_json_request(request: Request):
+    """
+    Comprueba que la petición declara un cuerpo JSON, igual que hace FastAPI
+
+    Acepta "application/json", cualquier "application/...+json" y peticiones
+    sin cabecera Content-Type
+
+    Args:
+        request (Request): Petición HTTP recibida
+
+    Returns:
+        bool: True si el cuerpo debe tratarse como JSON
+    """
+    content_type = request.headers.get("content-type")
+    if not content_type:
+        return True
+
+    media_type = content_type.split(";")[0].strip().lower()
+    return media_type == "application/json" or (
+        media_type.startswith("application/") and media_type.endswith("+json")
+    )
+
+
+def store_post(item: PostCreate):
+    """
+    Guarda un post nuevo en memoria y mantiene al día el índice y las versiones
+
+    Es la única forma de crear posts: la usan tanto POST /posts/create como
+    POST /posts/bulk, así todos los posts se guardan exactamente igual
+
+    Args:
+        item (PostCreate): Datos validados del nuevo post
+
+    Returns:
+        str: ID generado para el post
+    """
+    # Generamos un ID único para el post
+    # .hex devuelve el UUID como 32 caracteres hexadecimales, sin guiones
+    post_id = uuid().hex
+
+    # Construimos el Post completo: los datos del cliente más el ID generado.
+    # created_at lo rellena el propio modelo Post con su default_factory
+    post = Post(id=post_id, **item.model_dump())
+
+    # Lo convertimos a diccionario (con las fechas ya en texto) y lo guardamos
+    # en nuestra "base de datos" usando su ID como clave
+    posts[post_id] = post.model_dump(mode="json")
+    index_author(post_id, item.author)
+    bump_version(post_id)
+    return post_id
+
+
+def make_etag(version: int):
+    """
+    Construye el ETag (débil) correspondiente a una versión de este proceso
+
+    Args:
+        version (int): Versión del recurso
+
+    Returns:
+        str: ETag listo para enviar en la cabecera de la respuesta
+    """
+    return f'W/"{BOOT_ID}-{version}"'
+
+
+def not_modified(request: Request, etag: str):
+    """
+    Comprueba si el cliente ya tiene la versión actual del recurso
+
+    If-None-Match puede traer "*" o varios ETag separados por comas, y se
+    compara en modo "débil": se ignora el prefijo W/ de cada ETag
+
+    Args:
+        request (Request): Petición HTTP recibida
+        etag (str): ETag de la versión actual del recurso
+
+    Returns:
+        bool: True si la cabecera If-None-Match es "*" o contiene el ETag
+    """
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+
+    current = etag.removeprefix("W/")
+    for tag in header.split(","):
+        tag = tag.strip()
+        if tag == "*" or tag.removeprefix("W/") == current:
+            return True
+    return False
 
 
 # ENDPOINTS DE LA API (RUTAS)
 # ============================================================================
 # Los endpoints definen las URLs y métodos HTTP que acepta nuestra API
+# Se declaran con "async def" porque solo trabajan con datos en memoria (no hay
+# operaciones bloqueantes): así se ejecutan directamente en el bucle de eventos
+# en lugar de enviarse a un hilo del threadpool en cada petición
 
 
 # ENDPOINT RAÍZ - GET /
@@ -71,41 +329,63 @@ class PostUpdate(BaseModel):
 # Decorador @app.get: Define una ruta que responde a peticiones GET
 # El '/' indica que es la ruta raíz de nuestra API (ejemplo: http://localhost:8000/)
 @app.get("/")
-def read_root():
+async def read_root():
     """
     Endpoint de bienvenida - Punto de entrada principal de la API
 
     Returns:
         dict: Mensaje de bienvenida en formato JSON
     """
-    return {"Welcome": "Bienvenido a mi Clase de FastAPI"}
+    return WELCOME_MESSAGE
 
 
 # OBTENER TODOS LOS POSTS - GET /posts
 # ============================================================================
-@app.get("/posts")
-def get_posts():
+# response_model=None: los posts guardados ya son datos validados y en formato
+# JSON, así que no pedimos a FastAPI que los vuelva a validar; además los
+# devolvemos directamente en un ORJSONResponse, sin pasar por jsonable_encoder
+@app.get("/posts", response_model=None)
+async def get_posts(request: Request, author: Optional[str] = None):
     """
-    Obtiene todos los posts del blog
+    Obtiene todos los posts del blog, o solo los de un autor
+
+    Args:
+        request (Request): Petición HTTP, para leer la cabecera If-None-Match
+        author (str, opcional): Si se indica, solo se devuelven los posts de
+                                este autor (parámetro de consulta ?author=)
 
     Returns:
-        list: Lista con todos los posts almacenados en memoria
+        list: Lista con los posts almacenados en memoria
+              (o 304 Not Modified si el cliente ya tiene esta versión)
 
     Ejemplo de uso:
         GET http://localhost:8000/posts
+        GET http://localhost:8000/posts?author=Estudiante%20ILERNA
     """
-    return posts
+    etag = make_etag(posts_version)
+    if not_modified(request, etag):
+        return Response(status_code=304, headers={"ETag": etag})
+
+    if author is not None:
+        # Usamos el índice: solo visitamos los posts de este autor
+        # (get() no añade el autor al defaultdict si no existe)
+        content = [posts[post_id] for post_id in by_author.get(author, ())]
+    else:
+        # values() nos da los posts sin sus claves; los convertimos a lista
+        content = list(posts.values())
+
+    return ORJSONResponse(content, headers={"ETag": etag})
 
 
 # CREAR NUEVO POST - POST /posts/create
 # ============================================================================
 @app.post("/posts/create")
-def create_post(post: Post):
+async def create_post(post: PostCreate):
     """
         Crea un nuevo post en el blog
 
         Args:
-            post (Post): Objeto Post con los datos del nuevo post
+            post (PostCreate): Objeto PostCreate con los datos del nuevo post
                         FastAPI automáticamente valida que los datos cumplan el modelo
 
         Returns:
@@ -115,57 +395,155 @@ def create_post(post: Post):
             POST http://localhost:8000/posts/create
             Body (JSON):
     {
-      "id": "art-20251102-001",
       "title": "Cómo crear un monolito Python con FastAPI y Jinja2 paso a paso",
       "author": "Juan Carlos Sulbarán González",
       "content": "En este artículo exploraremos cómo montar un monolito web en Python utilizando FastAPI y Jinja2. Veremos cómo estructurar las carpetas, crear rutas GET y POST, validar formularios tanto en el frontend como en el backend, y finalmente desplegar el proyecto en un entorno local con Uvicorn. Este enfoque didáctico está pensado para estudiantes de FP en Desarrollo de Aplicaciones Web y Multiplataforma.",
-      "created_at": "2025-11-02T21:39:47.784832",
       "published_at": "2025-11-02T22:00:00.000Z",
       "published": true
     }
     """
-    # Generamos un ID único para el post
-    post.id = str(uuid())
-
-    # Convertimos el objeto Pydantic a diccionario y lo agregamos a nuestra "base de datos"
-    posts.append(post.model_dump())
+    # store_post() genera el ID, añade la fecha de creación y lo guarda
+    store_post(post)
 
     return {"message": "Post creado satisfactoriamente"}
 
 
+# CREAR VARIOS POSTS - POST /posts/bulk
+# ============================================================================
+# El cuerpo se valida a mano con post_list_adapter, así que describimos su
+# esquema con openapi_extra para que siga apareciendo en /docs
+@app.post(
+    "/posts/bulk",
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {"application/json": {"schema": bulk_body_schema}},
+        }
+    },
+)
+async def create_posts(request: Request):
+    """
+    Crea varios posts en una sola petición
+
+    Args:
+        request (Request): Petición HTTP; su cuerpo debe ser una lista de posts
+                           que validamos con post_list_adapter
+
+    Returns:
+        dict: Mensaje de confirmación
+
+    Ejemplo de uso:
+        POST http://localhost:8000/posts/bulk
+        Body (JSON):
+        [
+            {"title": "Post 1", "author": "Autor", "content": "Contenido 1"},
+            {"title": "Post 2", "author": "Autor", "content": "Contenido 2"}
+        ]
+
+    Raises:
+        RequestValidationError: Error 422 si el cuerpo no es JSON o si algún
+                                post no cumple el modelo
+    """
+    # Al leer el cuerpo a mano, comprobamos nosotros el Content-Type
+    # (FastAPI lo hace automáticamente en POST /posts/create)
+    if not is_json_request(request):
+        raise RequestValidationError(
+            [
+                {
+                    "type": "content_type",
+                    "loc": ("body",),
+                    "msg": "El cuerpo debe enviarse como application/json",
+                    "input": request.headers.get("content-type"),
+                }
+            ]
+        )
+
+    try:
+        items = post_list_adapter.validate_json(await request.body())
+    except ValidationError as error:
+        # Lo convertimos en el mismo error 422 que genera FastAPI automáticamente
+        raise RequestValidationError(
+            [{**e, "loc": ("body", *e["loc"])} for e in error.errors(include_url=False)]
+        )
+
+    # Guardamos cada post con store_post(), igual que POST /posts/create
+    for item in items:
+        store_post(item)
+
+    return {"message": "Posts creados satisfactoriamente"}
+
+
+# Guardamos el generador de OpenAPI que trae FastAPI para ampliarlo
+default_openapi = app.openapi
+
+
+def openapi_with_bulk_defs():
+    """
+    Genera el esquema OpenAPI añadiendo los modelos que usa POST /posts/bulk
+
+    FastAPI solo registra en components/schemas los modelos que ve en los
+    parámetros de los endpoints; el cuerpo de /posts/bulk lo describimos a
+    mano, así que registramos aquí sus definiciones para que las referencias
+    de bulk_body_schema siempre se resuelvan
+
+    Returns:
+        dict: Esquema OpenAPI de la aplicación (se calcula una sola vez)
+    """
+    if app.openapi_schema is None:
+        schema = default_openapi()
+        components = schema.setdefault("components", {})
+        schemas = components.setdefault("schemas", {})
+        for name, definition in bulk_body_defs.items():
+            schemas.setdefault(name, definition)
+    return app.openapi_schema
+
+
+# Sustituir app.openapi es la forma documentada por FastAPI de ampliar el
+# esquema; mypy lo marca porque openapi es un método de la clase
+app.openapi = openapi_with_bulk_defs  # type: ignore[method-assign]
+
+
 # OBTENER POST POR ID - GET /posts/{post_id}
 # ============================================================================
-@app.get("/posts/{post_id}")
-def get_post_by_id(post_id: str):
+# Igual que GET /posts: devolvemos el post guardado tal cual, sin revalidarlo
+@app.get("/posts/{post_id}", response_model=None)
+async def get_post_by_id(post_id: str, request: Request):
     """
     Obtiene un post específico por su ID único
 
     Args:
         post_id (str): ID único del post que queremos obtener
                       Se extrae automáticamente de la URL
+        request (Request): Petición HTTP, para leer la cabecera If-None-Match
 
     Returns:
         dict: Los datos del post encontrado
+              (o 304 Not Modified si el cliente ya tiene esta versión)
 
     Raises:
         HTTPException: Error 404 si el post no existe
 
     Ejemplo de uso:
-        GET http://localhost:8000/posts/abc-123-def-456
+        GET http://localhost:8000/posts/3f2a9c1e8b7d4e6fa0c1b2d3e4f5a6b7
     """
-    # Buscamos el post en nuestra lista
-    for post in posts:
-        if post["id"] == post_id:
-            return post
+    # get() busca directamente por clave y devuelve None si no existe
+    post = posts.get(post_id)
 
     # Si no encontramos el post, lanzamos una excepción HTTP 404
-    raise HTTPException(status_code=404, detail="Post no encontrado")
+    if post is None:
+        raise_not_found()
+
+    etag = make_etag(post_versions[post_id])
+    if not_modified(request, etag):
+        return Response(status_code=304, headers={"ETag": etag})
+
+    return ORJSONResponse(post, headers={"ETag": etag})
 
 
 # ELIMINAR POST - DELETE /posts/delete/{post_id}
 # ============================================================================
 @app.delete("/posts/delete/{post_id}")
-def delete_post(post_id: str):
+async def delete_post(post_id: str):
     """
     Elimina un post específico por su ID
 
@@ -179,23 +557,24 @@ def delete_post(post_id: str):
         HTTPException: Error 404 si el post no existe
 
     Ejemplo de uso:
-        DELETE http://localhost:8000/posts/delete/abc-123-def-456
+        DELETE http://localhost:8000/posts/delete/3f2a9c1e8b7d4e6fa0c1b2d3e4f5a6b7
     """
-    # enumerate() nos da tanto el índice como el valor en cada iteración
-    for index, post in enumerate(posts):
-        if post["id"] == post_id:
-            # pop() elimina el elemento en la posición indicada
-            posts.pop(index)
-            return {"message": "Post eliminado correctamente"}
+    # pop() elimina la clave indicada y devuelve su valor (o None si no existe)
+    post = posts.pop(post_id, None)
+    if post is None:
+        # Si llegamos aquí, el post no fue encontrado
+        raise_not_found()
+
+    unindex_author(post_id, post["author"])
+    drop_version(post_id)
 
-    # Si llegamos aquí, el post no fue encontrado
-    raise HTTPException(status_code=404, detail="Post no encontrado")
+    return {"message": "Post eliminado correctamente"}
 
 
 # ACTUALIZAR POST - PUT /posts/update/{post_id}
 # ============================================================================
 @app.put("/posts/update/{post_id}")
-def update_post(post_id: str, updatedPost: PostUpdate):
+async def update_post(post_id: str, updatedPost: PostUpdate):
     """
     Actualiza un post existente con nuevos datos
 
@@ -211,7 +590,7 @@ def update_post(post_id: str, updatedPost: PostUpdate):
         HTTPException: Error 404 si el post no existe
 
     Ejemplo de uso:
-        PUT http://localhost:8000/posts/update/abc-123-def-456
+        PUT http://localhost:8000/posts/update/3f2a9c1e8b7d4e6fa0c1b2d3e4f5a6b7
         Body (JSON):
         {
             "title": "Título actualizado",
@@ -220,15 +599,25 @@ def update_post(post_id: str, updatedPost: PostUpdate):
         }
     """
     # Buscamos el post que queremos actualizar
-    for post in posts:
-        if post["id"] == post_id:
-            # update() fusiona los nuevos datos con los existentes
-            # model_dump() convierte el objeto Pydantic a diccionario
-            post.update(updatedPost.model_dump())
-            return {"message": "Post actualizado correctamente"}
+    post = posts.get(post_id)
 
     # Si el post no existe, lanzamos error 404
-    raise HTTPException(status_code=404, detail="Post no encontrado")
+    if post is None:
+        raise_not_found()
+
+    # update() fusiona los nuevos datos con los existentes
+    # model_dump() convierte el objeto Pydantic a diccionario
+    # mode="json" deja las fechas en texto, igual que al crear el post
+    old_author = post["author"]
+    post.update(updatedPost.model_dump(mode="json"))
+
+    # Si cambia el autor, movemos el post al índice del nuevo autor
+    if post["author"] != old_author:
+        unindex_author(post_id, old_author)
+        index_author(post_id, post["author"])
+
+    bump_version(post_id)
+    return {"message": "Post actualizado correctamente"}
 
 
 # ============================================================================
@@ -243,6 +632,7 @@ def update_post(post_id: str, updatedPost: PostUpdate):
 #
 # 2. CÓDIGOS DE ESTADO HTTP:
 #    - 200: OK (operación exitosa)
+#    - 304: Not Modified (el cliente ya tiene la versión actual, según su ETag)
 #    - 404: Not Found (recurso no encontrado)
 #    - 422: Unprocessable Entity (datos inválidos - automático con Pydantic)
 #
@@ -254,8 +644,32 @@ def update_post(post_id: str, updatedPost: PostUpdate):
 #    Visita http://localhost:8000/docs para ver la documentación interactiva
 #    También disponible en formato ReDoc en http://localhost:8000/redoc
 #
-# 5. PARA EJECUTAR ESTA API:
+# 5. PARA EJECUTAR ESTA API (DESARROLLO):
 #    uvicorn main:app --reload
 #    Esto iniciará el servidor en http://localhost:8000
+#    --reload vigila los archivos y reinicia al guardar: solo para desarrollo
+#
+# 6. PARA EJECUTAR ESTA API (PRODUCCIÓN):
+#    gunicorn main:app -k uvicorn_worker.UvicornWorker \
+#        -w $((2*$(nproc)+1)) --bind 0.0.0.0:8000
+#    Gunicorn lanza varios procesos (workers) con Uvicorn; la regla habitual es
+#    2 * núcleos + 1, para aprovechar todos los núcleos de la máquina
+#
+#    Alternativa solo con Uvicorn, fijando el bucle de eventos uvloop y el
+#    parser HTTP httptools (ambos escritos en C/Cython, más rápidos que los
+#    de Python puro):
+#    uvicorn main:app --loop uvloop --http httptools --workers $((2*$(nproc)+1))
+#    Con gunicorn, UvicornWorker usa uvloop y httptools automáticamente
+#    siempre que estén instalados (vienen en requirements.txt)
+#
+#    Estos comandos son solo para Linux/macOS: gunicorn, uvicorn-worker y
+#    uvloop no funcionan en Windows (requirements.txt no los instala allí) y
+#    $((2*$(nproc)+1)) es sintaxis de bash. En Windows: uvicorn main:app --workers N
+#
+#    ¡OJO! Cada worker es un proceso independiente con su propia memoria:
+#    posts, by_author y las versiones (ETag) NO se comparten entre workers.
+#    Con varios workers, un post creado en uno no aparece en los demás.
+#    El siguiente paso para producción es mover estos datos a un almacén
+#    compartido como Redis (o a una base de datos)
 #
 # ============================================================================